@@ -232,7 +232,17 @@ backup_data() {
     
     # Create archive
     log_info "Creating backup archive..."
-    tar -czf "$backup_dir.tar.gz" -C "$(dirname "$backup_dir")" "$(basename "$backup_dir")"
+    # Compress on all cores with pigz when available; output stays plain gzip
+    if command -v pigz >/dev/null 2>&1; then
+        # pipefail so a tar read error is not masked by pigz's exit status
+        if ! (set -o pipefail; tar -cf - -C "$(dirname "$backup_dir")" "$(basename "$backup_dir")" | pigz > "$backup_dir.tar.gz"); then
+            log_error "Backup archive creation failed; staging copy kept in $backup_dir"
+            rm -f "$backup_dir.tar.gz"
+            return 1
+        fi
+    else
+        tar -czf "$backup_dir.tar.gz" -C "$(dirname "$backup_dir")" "$(basename "$backup_dir")"
+    fi
     rm -rf "$backup_dir"
     
     log_success "Backup completed: $backup_dir.tar.gz"
@@ -331,13 +341,15 @@ claude_init() {
     
     # Initialize environment configuration
     if [ ! -f "$HOME/.claude/config/environment.json" ]; then
+        local timestamp
+        timestamp=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
         cat > "$HOME/.claude/config/environment.json" << EOF
 {
   "version": "1.0.0",
   "environment": "development",
   "initialized": true,
-  "created": "$(date -u +"%Y-%m-%dT%H:%M:%SZ")",
-  "last_updated": "$(date -u +"%Y-%m-%dT%H:%M:%SZ")",
+  "created": "$timestamp",
+  "last_updated": "$timestamp",
   "services": {
     "postgresql": {
       "enabled": true,
@@ -380,30 +392,39 @@ claude_health() {
     log_info "Checking Claude Code + SuperClaude + MCP environment health..."
     echo ""
     
-    # Check core services
-    echo -e "${BLUE}🧠 Core Claude Services:${NC}"
     services=("postgres:5432" "redis:6379" "prometheus:9090" "grafana:3000")
+    additional_services=("jaeger:16686" "mailhog:8025" "minio:9000" "node-exporter:9100" "cadvisor:8080")
     
-    for service in "${services[@]}"; do
+    # Probe every service concurrently so the total wait is the slowest probe, not the sum
+    local pids=()
+    for service in "${services[@]}" "${additional_services[@]}"; do
         IFS=':' read -r host port <<< "$service"
-        if nc -z "$host" "$port" 2>/dev/null; then
-            echo "  ✅ $host:$port - Healthy"
+        nc -z -w 2 "$host" "$port" 2>/dev/null &
+        pids+=($!)
+    done
+    
+    # Check core services
+    echo -e "${BLUE}🧠 Core Claude Services:${NC}"
+    local i=0
+    for service in "${services[@]}"; do
+        if wait "${pids[$i]}"; then
+            echo "  ✅ $service - Healthy"
         else
-            echo "  ❌ $host:$port - Unhealthy"
+            echo "  ❌ $service - Unhealthy"
         fi
+        i=$((i + 1))
     done
     
     echo ""
     echo -e "${PURPLE}📊 Additional Services:${NC}"
-    additional_services=("jaeger:16686" "mailhog:8025" "minio:9000" "node-exporter:9100" "cadvisor:8080")
     
     for service in "${additional_services[@]}"; do
-        IFS=':' read -r host port <<< "$service"
-        if nc -z "$host" "$port" 2>/dev/null; then
-            echo "  ✅ $host:$port - Healthy"
+        if wait "${pids[$i]}"; then
+            echo "  ✅ $service - Healthy"
         else
-            echo "  ⚠️ $host:$port - Optional service not running"
+            echo "  ⚠️ $service - Optional service not running"
         fi
+        i=$((i + 1))
     done
     
     # Check Claude configuration
@@ -42,7 +42,7 @@ wait_for_service() {
     log_info "⏳ Waiting for $service_name to be ready at $host:$port..."
     
     while [ $attempt -le $max_attempts ]; do
-        if nc -z "$host" "$port" 2>/dev/null; then
+        if nc -z -w 2 "$host" "$port" 2>/dev/null; then
             log_success "$service_name is ready!"
             return 0
         fi
@@ -63,7 +63,7 @@ check_service_health() {
     local health_url=$2
     
     if command -v curl &> /dev/null; then
-        if curl -f -s "$health_url" > /dev/null 2>&1; then
+        if curl -f -s --max-time 5 "$health_url" > /dev/null 2>&1; then
             log_success "$service_name health check passed"
             return 0
         else
@@ -496,7 +496,7 @@ echo "🌐 Network Connectivity:"
 services=("postgres:5432" "redis:6379" "prometheus:9090" "grafana:3000")
 for service in "${services[@]}"; do
     IFS=':' read -r host port <<< "$service"
-    if nc -z "$host" "$port" 2>/dev/null; then
+    if nc -z -w 2 "$host" "$port" 2>/dev/null; then
         echo "  ✅ $service - OK"
     else
         echo "  ❌ $service - FAILED"
@@ -509,7 +509,7 @@ echo "🔗 API Endpoints:"
 if command -v curl &> /dev/null; then
     endpoints=("http://prometheus:9090/-/ready" "http://grafana:3000/api/health")
     for endpoint in "${endpoints[@]}"; do
-        if curl -f -s "$endpoint" > /dev/null 2>&1; then
+        if curl -f -s --max-time 5 "$endpoint" > /dev/null 2>&1; then
             echo "  ✅ $endpoint - OK"
         else
             echo "  ❌ $endpoint - FAILED"
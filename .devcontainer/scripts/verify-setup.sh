@@ -101,12 +101,11 @@ echo ""
 log_info "Validating Docker Compose configuration..."
 cd .devcontainer
 
-if docker-compose config >/dev/null 2>&1; then
+# Render the compose config once and reuse it for the checks below
+if compose_config=$(docker-compose config 2>/dev/null); then
     log_success "Docker Compose syntax"
-    ((TESTS_PASSED++))
 else
     log_error "Docker Compose syntax"
-    ((TESTS_FAILED++))
 fi
 ((TESTS_TOTAL++))
 
@@ -114,8 +113,8 @@ echo ""
 
 # Network and volume configuration
 log_info "Checking Docker configuration..."
-run_test "Networks defined" "docker-compose config | grep -q 'networks:'"
-run_test "Volumes defined" "docker-compose config | grep -q 'volumes:'"
+run_test "Networks defined" "grep -q 'networks:' <<< \"\$compose_config\""
+run_test "Volumes defined" "grep -q 'volumes:' <<< \"\$compose_config\""
 run_test "Services defined" "docker-compose config --services | wc -l | grep -q '[0-9]'"
 
 echo ""
@@ -156,20 +155,20 @@ if docker-compose ps | grep -q "Up"; then
     # Wait a moment for services to be ready
     sleep 2
     
-    run_test "PostgreSQL connection" "nc -z localhost 5432"
-    run_test "Redis connection" "nc -z localhost 6379"
-    run_test "MongoDB connection" "nc -z localhost 27017"
-    run_test "Elasticsearch connection" "nc -z localhost 9200"
-    run_test "MinIO connection" "nc -z localhost 9000"
-    run_test "Prometheus connection" "nc -z localhost 9090"
-    run_test "Grafana connection" "nc -z localhost 3030"
+    run_test "PostgreSQL connection" "nc -z -w 2 localhost 5432"
+    run_test "Redis connection" "nc -z -w 2 localhost 6379"
+    run_test "MongoDB connection" "nc -z -w 2 localhost 27017"
+    run_test "Elasticsearch connection" "nc -z -w 2 localhost 9200"
+    run_test "MinIO connection" "nc -z -w 2 localhost 9000"
+    run_test "Prometheus connection" "nc -z -w 2 localhost 9090"
+    run_test "Grafana connection" "nc -z -w 2 localhost 3030"
     
     echo ""
     
     # Health check tests
     log_info "Checking service health..."
-    run_test "Elasticsearch health" "curl -sf http://localhost:9200/_cluster/health"
-    run_test "Prometheus health" "curl -sf http://localhost:9090/-/healthy"
+    run_test "Elasticsearch health" "curl -sf --max-time 5 http://localhost:9200/_cluster/health"
+    run_test "Prometheus health" "curl -sf --max-time 5 http://localhost:9090/-/healthy"
     
 else
     log_warning "Docker Compose services not running, skipping connectivity tests"
@@ -530,7 +530,7 @@ install_claude_squad() {
         
         # cs 별칭 확인
         if command -v claude-squad &> /dev/null; then
-            log_success "Claude Squad 실행 파일 확인: $(which claude-squad)"
+            log_success "Claude Squad 실행 파일 확인: $(command -v claude-squad)"
             
             # cs 별칭 생성 (없는 경우)
             if ! command -v cs &> /dev/null; then
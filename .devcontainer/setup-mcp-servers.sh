@@ -41,11 +41,7 @@ add_mcp_server() {
     echo "   1단계: npm 전역 설치..."
     npm install -g "$package_name" 2>/dev/null
     
-    # 설치된 경로 찾기
-    local npm_root=$(npm root -g)
-    local bin_path="${npm_root}/$package_name/bin/index.js"
-    
-    # 다양한 실행 파일 위치 시도
+    # 다양한 실행 파일 위치 시도 (npm_root는 루프 전에 한 번만 조회)
     local possible_paths=(
         "${npm_root}/$package_name/dist/index.js"
         "${npm_root}/$package_name/index.js"
@@ -98,6 +94,9 @@ done
 echo ""
 echo "🔄 MCP 서버 추가 진행 중..."
 
+# 전역 npm 경로는 서버마다 바뀌지 않으므로 한 번만 조회
+npm_root=$(npm root -g)
+
 for server in "${servers[@]}"; do
     IFS='|' read -r name package <<< "$server"
     if add_mcp_server "$name" "$package"; then